@@ -0,0 +1,57 @@
+"""
+Compiled numeric kernels for pipeline risk post-processing
+Numba-jitted loops over whole prediction arrays, used on the batch scoring path
+"""
+
+import numpy as np
+from numba import njit, types
+
+# Risk level labels indexed by the codes returned from postprocess_predictions
+RISK_LEVELS = np.array(['low', 'medium', 'high', 'critical'], dtype=object)
+
+
+# Inputs are declared readonly so the kernel also accepts the read-only views pandas hands out
+# under copy-on-write (writable arrays convert to readonly, not the other way round)
+_float32_input = types.Array(types.float32, 1, 'A', readonly=True)
+
+
+# Explicit signature: compiled (or loaded from the on-disk cache) at import instead of on the first request
+@njit(
+    types.Tuple((types.int8[:], types.float64[:]))(_float32_input, _float32_input, _float32_input),
+    cache=True,
+    fastmath=True
+)
+def postprocess_predictions(failure_prob, age_years, corrosion_rate):
+    """
+    Convert failure probabilities to risk level codes and estimated days to failure
+    
+    Uses the same thresholds and formula as PipelineRiskPredictor._get_risk_level
+    and _estimate_failure_date (codes: 0 = low, 1 = medium, 2 = high, 3 = critical;
+    days are NaN where no failure date is estimated). Inputs must be float32 arrays.
+    """
+    n = failure_prob.shape[0]
+    codes = np.empty(n, np.int8)
+    days = np.empty(n, np.float64)
+    for i in range(n):
+        p = failure_prob[i]
+        if p >= 0.7:
+            codes[i] = 3
+        elif p >= 0.5:
+            codes[i] = 2
+        elif p >= 0.3:
+            codes[i] = 1
+        else:
+            codes[i] = 0
+        
+        if p < 0.3:
+            days[i] = np.nan
+            continue
+        
+        # Higher probability = sooner failure; old and corroding pipelines fail sooner still
+        years = max(0.5, (1.0 - p) * 10.0)
+        if age_years[i] > 25:
+            years *= 0.8
+        if corrosion_rate[i] > 0.1:
+            years *= 0.7
+        days[i] = years * 365.0
+    return codes, days
@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the AI model API
+One worker process per CPU core runs model inference; each worker's thread pool
+lets concurrent requests overlap their database round trips
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8000)}"
+
+# CPU-bound inference: one process per core, capped by default because cpu_count()
+# reports the host's cores rather than the container's CPU limit
+workers = int(os.getenv('GUNICORN_WORKERS', min(multiprocessing.cpu_count(), 4)))
+
+# I/O-bound database calls: threads per worker (keep DB_POOL_MAX >= threads).
+# Each worker has its own pool, so replicas x workers x DB_POOL_MAX must stay well
+# below Postgres max_connections (100 by default), which the backend shares
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+
+# Load the model once in the master and share it copy-on-write with the workers
+preload_app = True
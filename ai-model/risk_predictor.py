@@ -5,8 +5,8 @@ Advanced ML model for predicting pipeline failure probability using multiple fac
 
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import joblib
@@ -15,11 +15,34 @@ from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import json
 import os
+import time
+import uuid
+
+# Treelite runs the trained forests natively; inference falls back to sklearn without it
+try:
+    import treelite
+    import treelite.gtil
+except ImportError:
+    treelite = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (second, formatted) pair; swapped as one tuple so readers never see a torn update
+_timestamp_cache = (0, '')
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, formatted at most once per second"""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, formatted = _timestamp_cache
+    if cached_second != second:
+        formatted = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second))
+        _timestamp_cache = (second, formatted)
+    return formatted
+
 class PipelineRiskPredictor:
     """
     Advanced machine learning model for pipeline failure risk prediction
@@ -33,19 +56,27 @@ class PipelineRiskPredictor:
                 max_depth=10,
                 min_samples_split=5,
                 min_samples_leaf=2,
-                random_state=42
+                random_state=42,
+                n_jobs=-1
             ),
-            'gradient_boosting': GradientBoostingRegressor(
-                n_estimators=100,
+            'gradient_boosting': HistGradientBoostingRegressor(
+                max_iter=100,
                 learning_rate=0.1,
                 max_depth=6,
+                early_stopping=True,
                 random_state=42
             )
         }
+        self.compiled_models = {}
         self.scaler = StandardScaler()
-        self.label_encoders = {}
+        self.category_dtypes = {}
+        self.category_codes = {}
+        self.fill_values = None
+        self.feature_names = None
         self.feature_importance = {}
         self.is_trained = False
+        # Identifies one trained model across processes (e.g. to key cached predictions)
+        self.model_id = None
         
         # Feature definitions
         self.numerical_features = [
@@ -69,112 +100,146 @@ class PipelineRiskPredictor:
         """
         Create additional features from raw pipeline data
         
+        Features the caller already supplied (e.g. age_years computed upstream)
+        are kept as-is rather than recomputed.
+        
         Args:
             df: Raw pipeline data DataFrame
             
         Returns:
             DataFrame with engineered features
         """
-        df_engineered = df.copy()
+        # Derived columns are collected here and attached with one assign, which doesn't copy the input columns
+        new_columns = {}
         
         try:
             # Age-related features
-            if 'installation_date' in df.columns:
-                df_engineered['age_years'] = (
-                    pd.to_datetime('now') - pd.to_datetime(df['installation_date'])
-                ).dt.days / 365.25
+            if 'installation_date' in df.columns and 'age_years' not in df.columns:
+                installed = df['installation_date']
+                if not pd.api.types.is_datetime64_any_dtype(installed):
+                    installed = pd.to_datetime(installed, cache=True)
+                age_days = (
+                    np.datetime64('now', 's') - installed.to_numpy(dtype='datetime64[s]')
+                ) / np.timedelta64(1, 'D')
+                new_columns['age_years'] = (np.floor(age_days) / 365.25).astype(np.float32)
                 
             # Pressure ratio (operating vs rating)
-            if 'operating_pressure' in df.columns and 'pressure_rating' in df.columns:
-                df_engineered['pressure_ratio'] = (
-                    df_engineered['operating_pressure'] / df_engineered['pressure_rating']
+            if ('operating_pressure' in df.columns and 'pressure_rating' in df.columns
+                    and 'pressure_ratio' not in df.columns):
+                new_columns['pressure_ratio'] = (
+                    df['operating_pressure'].to_numpy() / df['pressure_rating'].to_numpy()
                 )
                 
             # Wall thickness ratio (current vs original)
-            if 'current_wall_thickness' in df.columns and 'original_wall_thickness' in df.columns:
-                df_engineered['wall_thickness_ratio'] = (
-                    df_engineered['current_wall_thickness'] / df_engineered['original_wall_thickness']
+            if ('current_wall_thickness' in df.columns and 'original_wall_thickness' in df.columns
+                    and 'wall_thickness_ratio' not in df.columns):
+                new_columns['wall_thickness_ratio'] = (
+                    df['current_wall_thickness'].to_numpy() / df['original_wall_thickness'].to_numpy()
                 )
                 
             # Corrosion rate acceleration
-            if 'corrosion_rate' in df.columns and 'age_years' in df_engineered.columns:
-                df_engineered['corrosion_acceleration'] = (
-                    df_engineered['corrosion_rate'] * df_engineered['age_years']
+            age_years = new_columns['age_years'] if 'age_years' in new_columns else df.get('age_years')
+            if ('corrosion_rate' in df.columns and age_years is not None
+                    and 'corrosion_acceleration' not in df.columns):
+                # Caller-supplied columns may hold Decimals straight from the database
+                new_columns['corrosion_acceleration'] = (
+                    pd.to_numeric(df['corrosion_rate'], errors='coerce').to_numpy(dtype=np.float32) *
+                    np.asarray(pd.to_numeric(age_years, errors='coerce'), dtype=np.float32)
                 )
                 
             # Risk factor composite scores
-            if all(factor in df.columns for factor in self.risk_factors):
-                df_engineered['composite_risk_score'] = (
-                    df_engineered[self.risk_factors].mean(axis=1)
-                )
-                df_engineered['max_risk_factor'] = (
-                    df_engineered[self.risk_factors].max(axis=1)
-                )
+            missing_scores = [c for c in ('composite_risk_score', 'max_risk_factor') if c not in df.columns]
+            if missing_scores and all(factor in df.columns for factor in self.risk_factors):
+                # Row-wise reductions on one float32 block, skipping NaNs like pandas does
+                risk = df[self.risk_factors].to_numpy(dtype=np.float32)
+                if 'composite_risk_score' in missing_scores:
+                    valid = ~np.isnan(risk)
+                    with np.errstate(invalid='ignore'):
+                        new_columns['composite_risk_score'] = (
+                            np.where(valid, risk, 0).sum(axis=1) / valid.sum(axis=1, dtype=np.float32)
+                        )
+                if 'max_risk_factor' in missing_scores:
+                    new_columns['max_risk_factor'] = np.fmax.reduce(risk, axis=1)
                 
             # Environmental stress index
             environmental_factors = ['temperature_avg', 'soil_resistivity', 'depth_avg']
             available_env_factors = [f for f in environmental_factors if f in df.columns]
-            if available_env_factors:
-                # Normalize and combine environmental factors
-                for factor in available_env_factors:
-                    df_engineered[f'{factor}_normalized'] = (
-                        (df_engineered[factor] - df_engineered[factor].mean()) / 
-                        df_engineered[factor].std()
+            if available_env_factors and 'environmental_stress' not in df.columns:
+                # Normalize and combine environmental factors in one pass (sample std, NaN-aware like pandas)
+                env = df[available_env_factors].to_numpy(dtype=np.float32)
+                valid = ~np.isnan(env)
+                count = valid.sum(axis=0, dtype=np.float32)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    centered = env - np.where(valid, env, 0).sum(axis=0) / count
+                    std = np.sqrt(np.where(valid, centered ** 2, 0).sum(axis=0) / (count - 1))
+                    z_scores = np.abs(centered / std)
+                    z_valid = ~np.isnan(z_scores)
+                    new_columns['environmental_stress'] = (
+                        np.where(z_valid, z_scores, 0).sum(axis=1) / z_valid.sum(axis=1, dtype=np.float32)
                     )
                 
-                df_engineered['environmental_stress'] = (
-                    df_engineered[[f'{f}_normalized' for f in available_env_factors]].abs().mean(axis=1)
-                )
-                
-            logger.info(f"Feature engineering completed. Shape: {df_engineered.shape}")
+            logger.info(f"Feature engineering completed. Derived columns: {len(new_columns)}")
             
         except Exception as e:
             logger.error(f"Feature engineering failed: {str(e)}")
             
+        df_engineered = df.assign(**new_columns)
         return df_engineered
         
-    def prepare_data(self, df: pd.DataFrame) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    def prepare_data(self, df: pd.DataFrame, prepared: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """
         Prepare data for training or prediction
         
         Args:
             df: Input DataFrame
+            prepared: Set when df already carries every engineered feature the model
+                uses (age_years in particular), so feature engineering is skipped
             
         Returns:
             Tuple of (features, target) where target is None for prediction
         """
-        df_prepared = self.engineer_features(df)
+        # Shallow copy so encoding the categoricals below doesn't write into the caller's frame
+        df_prepared = df.copy(deep=False) if prepared else self.engineer_features(df)
+        
+        if self.is_trained and self.feature_names is not None:
+            # Score with exactly the training features; absent columns are added empty and imputed below
+            available_features = list(self.feature_names)
+            present = df_prepared.columns.intersection(available_features)
+            if present.empty:
+                raise ValueError("No valid features found in the data")
+            if len(present) < len(available_features):
+                df_prepared = df_prepared.reindex(
+                    columns=df_prepared.columns.union(available_features, sort=False)
+                )
+        else:
+            available_features = [f for f in (self.numerical_features + self.categorical_features) 
+                                 if f in df_prepared.columns]
         
         # Handle categorical variables
         for feature in self.categorical_features:
             if feature in df_prepared.columns:
-                if feature not in self.label_encoders:
-                    self.label_encoders[feature] = LabelEncoder()
-                    df_prepared[feature] = self.label_encoders[feature].fit_transform(
-                        df_prepared[feature].astype(str)
+                values = df_prepared[feature].astype(str)
+                if feature not in self.category_dtypes:
+                    # Sorted categories give the same codes LabelEncoder used to assign
+                    self.category_dtypes[feature] = pd.CategoricalDtype(
+                        categories=np.sort(values.dropna().unique())
                     )
-                else:
-                    # Handle unseen categories in prediction
-                    try:
-                        df_prepared[feature] = self.label_encoders[feature].transform(
-                            df_prepared[feature].astype(str)
-                        )
-                    except ValueError:
-                        # Use most common category for unseen values
-                        most_common = self.label_encoders[feature].classes_[0]
-                        df_prepared[feature] = df_prepared[feature].astype(str).apply(
-                            lambda x: x if x in self.label_encoders[feature].classes_ else most_common
-                        )
-                        df_prepared[feature] = self.label_encoders[feature].transform(df_prepared[feature])
-        
-        # Select features for modeling
-        available_features = [f for f in (self.numerical_features + self.categorical_features) 
-                             if f in df_prepared.columns]
+                # Unseen and missing categories come back as -1 and are mapped to the first category
+                codes = values.astype(self.category_dtypes[feature]).cat.codes.to_numpy(np.int16)
+                df_prepared[feature] = np.maximum(codes, 0)
         
         if not available_features:
             raise ValueError("No valid features found in the data")
         
-        X = df_prepared[available_features].fillna(df_prepared[available_features].median())
+        # float32 is the dtype sklearn trees evaluate in, so this avoids an internal copy
+        X = df_prepared[available_features].astype(np.float32)
+        
+        # Impute with the training medians so predictions don't depend on the batch they arrive in
+        # (models saved without them fall back to the batch medians)
+        if not self.is_trained:
+            self.fill_values = X.median().to_dict()
+            self.feature_names = tuple(available_features)
+        X = X.fillna(self.fill_values if self.fill_values is not None else X.median()).to_numpy()
         
         # Scale features
         if self.is_trained:
@@ -228,7 +293,9 @@ class PipelineRiskPredictor:
             y_pred_test = model.predict(X_test)
             
             # Cross-validation score
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='neg_mean_squared_error')
+            cv_scores = cross_val_score(
+                model, X_train, y_train, cv=5, scoring='neg_mean_squared_error', n_jobs=-1
+            )
             
             model_scores[name] = {
                 'train_mse': mean_squared_error(y_train, y_pred_train),
@@ -241,11 +308,15 @@ class PipelineRiskPredictor:
             
             # Feature importance
             if hasattr(model, 'feature_importances_'):
-                available_features = [f for f in (self.numerical_features + self.categorical_features) 
-                                     if f in df.columns]
-                self.feature_importance[name] = dict(zip(available_features, model.feature_importances_))
+                self.feature_importance[name] = dict(zip(self.feature_names, model.feature_importances_))
+        
+        # Per-tree threading only adds dispatch overhead to the small batches served at inference
+        self.models['random_forest'].set_params(n_jobs=1)
         
         self.is_trained = True
+        self.model_id = uuid.uuid4().hex
+        self._index_categories()
+        self._compile_models()
         
         # Log results
         for name, scores in model_scores.items():
@@ -253,46 +324,121 @@ class PipelineRiskPredictor:
         
         return model_scores
         
-    def predict(self, df: pd.DataFrame, return_confidence: bool = True) -> Dict:
+    def _index_categories(self):
+        """Build category -> code lookups for encoding single values without pandas"""
+        self.category_codes = {
+            feature: {category: code for code, category in enumerate(dtype.categories)}
+            for feature, dtype in self.category_dtypes.items()
+        }
+        
+    def _compile_models(self):
+        """Convert the trained ensembles to Treelite models for native inference"""
+        self.compiled_models = {}
+        if treelite is None:
+            return
+        
+        for name, model in self.models.items():
+            try:
+                self.compiled_models[name] = treelite.sklearn.import_model(model)
+            except Exception as e:
+                logger.warning(f"Could not compile {name}, using sklearn inference: {str(e)}")
+        
+    def predict(self, df: pd.DataFrame, return_confidence: bool = True, prepared: bool = False) -> Dict:
         """
         Make failure probability predictions
         
         Args:
             df: Pipeline data for prediction
             return_confidence: Whether to include confidence intervals
+            prepared: Skip feature engineering (see prepare_data)
             
         Returns:
-            Dictionary with predictions and metadata
+            Dictionary with predictions and metadata (per-pipeline values as NumPy arrays)
         """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
         
-        X, _ = self.prepare_data(df)
+        X, _ = self.prepare_data(df, prepared=prepared)
+        ensemble_pred, confidence, predictions = self._predict_ensemble(X)
+        
+        results = {
+            'failure_probability': ensemble_pred,
+            'confidence_score': confidence if return_confidence else None,
+            'individual_predictions': predictions,
+            'model_version': '1.0',
+            'prediction_date': now_iso()
+        }
+        
+        return results
         
+    def _predict_ensemble(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Run every model on a scaled feature matrix and combine them into the ensemble output"""
         # Get predictions from all models
         predictions = {}
         for name, model in self.models.items():
-            predictions[name] = model.predict(X)
-        
-        # Ensemble prediction (weighted average)
-        ensemble_pred = (predictions['random_forest'] * 0.6 + 
-                        predictions['gradient_boosting'] * 0.4)
+            compiled = self.compiled_models.get(name)
+            if compiled is not None:
+                # Single-threaded like sklearn's predict; the server parallelizes across requests
+                predictions[name] = treelite.gtil.predict(compiled, X, nthread=1).ravel()
+            else:
+                predictions[name] = model.predict(X)
+        
+        # Ensemble prediction (weighted average) over the stacked (n_models, n_rows) array
+        stacked = np.stack([
+            predictions['random_forest'], predictions['gradient_boosting']
+        ]).astype(np.float32, copy=False)
+        ensemble_pred = np.array([0.6, 0.4], dtype=np.float32) @ stacked
         
         # Calculate confidence based on prediction agreement
-        pred_std = np.std([predictions['random_forest'], predictions['gradient_boosting']], axis=0)
+        pred_std = stacked.std(axis=0)
         confidence = np.clip(1 - (pred_std * 2), 0.1, 1.0)  # Higher std = lower confidence
         
-        results = {
-            'failure_probability': ensemble_pred.tolist(),
-            'confidence_score': confidence.tolist() if return_confidence else None,
-            'individual_predictions': {
-                name: pred.tolist() for name, pred in predictions.items()
-            },
-            'model_version': '1.0',
-            'prediction_date': datetime.now().isoformat()
-        }
+        return ensemble_pred, confidence, predictions
         
-        return results
+    def _predict_vector(self, pipeline_data: Dict) -> Optional[Tuple[float, float]]:
+        """
+        Score one pipeline from a 1xD feature row, bypassing DataFrame construction
+        
+        Args:
+            pipeline_data: Dictionary with pipeline attributes
+            
+        Returns:
+            Tuple of (failure_probability, confidence), or None when the model
+            predates cached fill values and the DataFrame path must be used
+        """
+        if self.fill_values is None or self.feature_names is None:
+            return None
+        
+        values = dict(pipeline_data)
+        if 'installation_date' in values and 'age_years' not in values:
+            # Same whole-day age computation as engineer_features
+            installed = pd.to_datetime(values['installation_date'], errors='coerce')
+            if not pd.isna(installed):
+                age_days = (np.datetime64('now', 's') - installed.to_datetime64()) / np.timedelta64(1, 'D')
+                values['age_years'] = np.floor(age_days) / 365.25
+        
+        # Imputing every feature would score an arbitrary payload as a median pipeline
+        if values.keys().isdisjoint(self.feature_names):
+            raise ValueError("No valid features found in the data")
+        
+        row = []
+        for feature in self.feature_names:
+            value = values.get(feature)
+            if feature in self.category_codes:
+                # Unseen and missing categories map to the first category, as in prepare_data
+                row.append(0 if pd.isna(value) else self.category_codes[feature].get(str(value), 0))
+            elif value is None or pd.isna(value):
+                # Missing or absent features get the training median
+                row.append(self.fill_values[feature])
+            else:
+                row.append(float(value))
+        
+        x = np.array([row], dtype=np.float32)
+        x -= self.scaler.mean_.astype(np.float32)
+        x /= self.scaler.scale_.astype(np.float32)
+        
+        ensemble_pred, confidence, _ = self._predict_ensemble(x)
+        return float(ensemble_pred[0]), float(confidence[0])
         
     def predict_single_pipeline(self, pipeline_data: Dict) -> Dict:
         """
@@ -304,11 +450,21 @@ class PipelineRiskPredictor:
         Returns:
             Prediction result with recommendations
         """
-        df = pd.DataFrame([pipeline_data])
-        prediction = self.predict(df, return_confidence=True)
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
         
-        failure_prob = prediction['failure_probability'][0]
-        confidence = prediction['confidence_score'][0] if prediction['confidence_score'] else 0.8
+        scores = self._predict_vector(pipeline_data)
+        if scores is not None:
+            failure_prob, confidence = scores
+        else:
+            df = pd.DataFrame([pipeline_data])
+            prediction = self.predict(df, return_confidence=True)
+            
+            failure_prob = float(prediction['failure_probability'][0])
+            confidence = (
+                float(prediction['confidence_score'][0])
+                if prediction['confidence_score'] is not None else 0.8
+            )
         
         # Generate recommendations based on risk level
         recommendations = self._generate_recommendations(failure_prob, pipeline_data)
@@ -325,7 +481,7 @@ class PipelineRiskPredictor:
             'recommendations': recommendations,
             'input_parameters': pipeline_data,
             'prediction_model': 'ensemble_v1.0',
-            'created_at': datetime.now().isoformat()
+            'created_at': now_iso()
         }
         
     def _generate_recommendations(self, failure_prob: float, pipeline_data: Dict) -> List[str]:
@@ -407,15 +563,22 @@ class PipelineRiskPredictor:
         if not self.is_trained:
             raise ValueError("Model must be trained before saving")
         
+        # Inference runs in float32, so the scaler statistics don't need double precision
+        for attr in ('mean_', 'scale_', 'var_'):
+            setattr(self.scaler, attr, getattr(self.scaler, attr).astype(np.float32))
+        
         model_data = {
             'models': self.models,
             'scaler': self.scaler,
-            'label_encoders': self.label_encoders,
+            'category_dtypes': self.category_dtypes,
+            'fill_values': self.fill_values,
+            'feature_names': self.feature_names,
             'feature_importance': self.feature_importance,
-            'is_trained': self.is_trained
+            'is_trained': self.is_trained,
+            'model_id': self.model_id
         }
         
-        joblib.dump(model_data, filepath)
+        joblib.dump(model_data, filepath, compress=('lz4', 3), protocol=5)
         logger.info(f"Model saved to {filepath}")
         
     def load_model(self, filepath: str):
@@ -423,13 +586,30 @@ class PipelineRiskPredictor:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Model file not found: {filepath}")
         
+        # Compressed files can't be memory-mapped; workers share the preloaded model via fork instead
         model_data = joblib.load(filepath)
         
         self.models = model_data['models']
         self.scaler = model_data['scaler']
-        self.label_encoders = model_data['label_encoders']
+        if 'category_dtypes' in model_data:
+            self.category_dtypes = model_data['category_dtypes']
+        else:
+            # Models saved before the categorical dtype switch carry fitted LabelEncoders
+            self.category_dtypes = {
+                feature: pd.CategoricalDtype(categories=pd.Index(encoder.classes_).dropna())
+                for feature, encoder in model_data['label_encoders'].items()
+            }
         self.feature_importance = model_data['feature_importance']
+        self.fill_values = model_data.get('fill_values')
+        self.feature_names = model_data.get('feature_names')
         self.is_trained = model_data['is_trained']
+        # Files saved before model ids existed are identified by their modification time
+        self.model_id = model_data.get('model_id') or f"mtime-{os.stat(filepath).st_mtime_ns}"
+        
+        # Category lookups and compiled models are rebuilt from the saved state rather than persisted
+        if self.is_trained:
+            self._index_categories()
+            self._compile_models()
         
         logger.info(f"Model loaded from {filepath}")
         
@@ -451,38 +631,48 @@ def create_sample_data(n_samples: int = 1000) -> pd.DataFrame:
     Returns:
         DataFrame with sample pipeline data
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     materials = ['Carbon Steel', 'Stainless Steel', 'HDPE', 'Fiberglass']
     coating_types = ['FBE', '3LPE', 'Tape', 'None']
     soil_types = ['Clay', 'Sand', 'Rock', 'Mixed']
     environment_types = ['Rural', 'Urban', 'Industrial', 'Marine']
     
+    def uniform(low, high):
+        return rng.uniform(low, high, n_samples).astype(np.float32)
+    
+    def category(values):
+        return pd.Categorical.from_codes(rng.integers(0, len(values), n_samples), values)
+    
+    def severity():
+        return rng.integers(1, 6, n_samples, dtype=np.int8)
+    
+    # Columns are generated directly in their final (small) dtypes so the DataFrame can adopt them without copying
     data = {
-        'id': range(1, n_samples + 1),
-        'age_years': np.random.uniform(5, 50, n_samples),
-        'diameter': np.random.choice([6, 8, 10, 12, 16, 20, 24, 30], n_samples),
-        'pressure_rating': np.random.uniform(600, 1500, n_samples),
-        'operating_pressure': np.random.uniform(300, 1200, n_samples),
-        'length_km': np.random.uniform(1, 100, n_samples),
-        'depth_avg': np.random.uniform(0.5, 3.0, n_samples),
-        'temperature_avg': np.random.uniform(5, 45, n_samples),
-        'wall_thickness': np.random.uniform(6, 20, n_samples),
-        'material': np.random.choice(materials, n_samples),
-        'coating_type': np.random.choice(coating_types, n_samples),
-        'soil_type': np.random.choice(soil_types, n_samples),
-        'environment_type': np.random.choice(environment_types, n_samples),
-        'corrosion_rate': np.random.uniform(0.01, 0.5, n_samples),
-        'soil_resistivity': np.random.uniform(500, 5000, n_samples),
-        'cathodic_protection_level': np.random.uniform(0.85, 1.2, n_samples),
-        'corrosion_severity': np.random.randint(1, 6, n_samples),
-        'depth_variation': np.random.randint(1, 6, n_samples),
-        'pressure_fluctuation': np.random.randint(1, 6, n_samples),
-        'temperature_variation': np.random.randint(1, 6, n_samples),
-        'external_damage_risk': np.random.randint(1, 6, n_samples),
+        'id': np.arange(1, n_samples + 1),
+        'age_years': uniform(5, 50),
+        'diameter': rng.choice(np.array([6, 8, 10, 12, 16, 20, 24, 30], dtype=np.int16), n_samples),
+        'pressure_rating': uniform(600, 1500),
+        'operating_pressure': uniform(300, 1200),
+        'length_km': uniform(1, 100),
+        'depth_avg': uniform(0.5, 3.0),
+        'temperature_avg': uniform(5, 45),
+        'wall_thickness': uniform(6, 20),
+        'material': category(materials),
+        'coating_type': category(coating_types),
+        'soil_type': category(soil_types),
+        'environment_type': category(environment_types),
+        'corrosion_rate': uniform(0.01, 0.5),
+        'soil_resistivity': uniform(500, 5000),
+        'cathodic_protection_level': uniform(0.85, 1.2),
+        'corrosion_severity': severity(),
+        'depth_variation': severity(),
+        'pressure_fluctuation': severity(),
+        'temperature_variation': severity(),
+        'external_damage_risk': severity(),
     }
     
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(data, copy=False)
     
     # Create realistic failure probabilities based on features
     failure_prob = (
@@ -490,7 +680,7 @@ def create_sample_data(n_samples: int = 1000) -> pd.DataFrame:
         (df['corrosion_rate'] / 0.5) * 0.3 +
         (df['corrosion_severity'] / 5) * 0.2 +
         ((df['pressure_rating'] - df['operating_pressure']) / df['pressure_rating']) * -0.1 +
-        np.random.normal(0, 0.1, n_samples)
+        rng.normal(0, 0.1, n_samples).astype(np.float32)
     )
     
     df['failure_probability'] = np.clip(failure_prob, 0, 1)
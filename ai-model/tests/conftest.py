@@ -0,0 +1,9 @@
+"""
+Pytest configuration for the AI model service
+Makes the service modules (api_server, risk_predictor, fast_ops) importable from the tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,154 @@
+"""
+Tests for model reloading, retraining job state and batch caching in the API server
+"""
+
+import os
+import pickle
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+
+import api_server
+from risk_predictor import PipelineRiskPredictor, create_sample_data
+
+
+@pytest.fixture
+def model_file(tmp_path, monkeypatch):
+    """Point the server at a temporary model file and load it"""
+    monkeypatch.setattr(api_server, 'MODEL_PATH', str(tmp_path / 'model.joblib'))
+    monkeypatch.setattr(api_server, 'redis_client', None)
+    api_server.load_model()
+    return api_server.MODEL_PATH
+
+
+def train_model():
+    model = PipelineRiskPredictor()
+    model.train(create_sample_data(200))
+    return model
+
+
+def test_reloads_model_saved_by_another_worker(model_file):
+    original = api_server.predictor
+    retrained = train_model()
+    api_server.save_model_file(retrained)
+    # Make the change visible even on filesystems with coarse timestamps
+    os.utime(model_file, ns=(0, api_server.model_mtime + 1))
+    
+    api_server.model_checked_at = 0.0
+    api_server.app.test_client().get('/health')
+    
+    assert api_server.predictor is not original
+    assert api_server.predictor.model_id == retrained.model_id
+    assert not [f for f in os.listdir(os.path.dirname(model_file)) if f.endswith('.tmp')]
+
+
+def test_cached_predictions_are_scoped_to_the_model(model_file):
+    api_server.cache_prediction(api_server.predictor, 'batch', [1, 2])
+    
+    assert api_server.get_cached_prediction(api_server.predictor, 'batch') == [1, 2]
+    assert api_server.get_cached_prediction(train_model(), 'batch') is None
+
+
+def test_retrain_job_status_round_trip(model_file):
+    api_server.save_retrain_job({'job_id': 'job-1', 'state': 'queued'})
+    api_server.update_retrain_job('job-1', state='completed')
+    
+    response = api_server.app.test_client().get('/retrain/status/job-1')
+    
+    assert response.status_code == 200
+    assert response.get_json()['job']['state'] == 'completed'
+    assert api_server.app.test_client().get('/retrain/status/unknown').status_code == 404
+
+
+def run_batch(batches):
+    model = api_server.predictor
+    scored_chunks = (api_server.predict_batch_chunk(model, df) for df in batches)
+    body = b''.join(api_server.generate_batch_predictions(model, scored_chunks))
+    return orjson.loads(body)
+
+
+def sample_batch(n):
+    batch = create_sample_data(n).drop(columns=['failure_probability'])
+    batch['name'] = [f'P{i}' for i in batch['id']]
+    return batch
+
+
+def test_batch_results_are_cached_as_serialized_chunks(model_file):
+    batches = [sample_batch(3), sample_batch(2)]
+    streamed = run_batch(batches)
+    
+    total, predictions_json = api_server.get_cached_batch(api_server.predictor)
+    
+    assert streamed['total_pipelines'] == total == 5
+    assert orjson.loads(b'[' + predictions_json + b']') == streamed['predictions']
+
+
+def test_batch_larger_than_cache_bound_is_not_cached(model_file, monkeypatch):
+    monkeypatch.setattr(api_server, 'BATCH_CACHE_MAX_ROWS', 4)
+    
+    streamed = run_batch([sample_batch(3), sample_batch(2)])
+    
+    assert streamed['total_pipelines'] == 5
+    assert api_server.get_cached_batch(api_server.predictor) is None
+
+
+def test_pipeline_prediction_echoes_timestamp_columns(model_file, monkeypatch):
+    """p.* includes TIMESTAMP columns, which from_records turns into pd.Timestamp / NaT"""
+    columns = ['id', 'name', 'installation_date', 'created_at', 'updated_at',
+               'age_years', 'corrosion_rate', 'material', 'coating_type']
+    rows = [(7, 'P7', date(2001, 5, 1), datetime(2024, 1, 2, 3, 4, 5), None,
+             Decimal('23'), Decimal('0.12'), 'steel', 'epoxy')]
+    monkeypatch.setattr(api_server, 'fetch_pipeline_data',
+                        lambda pipeline_id: pd.DataFrame.from_records(rows, columns=columns))
+    
+    response = api_server.app.test_client().post('/predict/pipeline/7')
+    
+    assert response.status_code == 200, response.get_json()
+    params = response.get_json()['prediction']['input_parameters']
+    assert params['created_at'] == '2024-01-02T03:04:05'
+    assert params['updated_at'] is None
+
+
+def test_redis_cache_stores_plain_json(model_file, monkeypatch):
+    fakeredis = pytest.importorskip('fakeredis')
+    client = fakeredis.FakeRedis()
+    monkeypatch.setattr(api_server, 'redis_client', client)
+    model = api_server.predictor
+    
+    api_server.cache_prediction(model, 'predict:x', {'failure_probability': np.float32(0.5)})
+    api_server.cache_batch(model, 2, b'{"pipeline_id":1},{"pipeline_id":2}')
+    
+    assert orjson.loads(client.get(f'pred:{model.model_id}:predict:x')) == {'failure_probability': 0.5}
+    assert api_server.get_cached_prediction(model, 'predict:x') == {'failure_probability': 0.5}
+    assert api_server.get_cached_batch(model) == (2, b'{"pipeline_id":1},{"pipeline_id":2}')
+    
+    # Entries written by anything else sharing the Redis instance are never unpickled
+    client.set(f'pred:{model.model_id}:predict:y', pickle.dumps({'a': 1}))
+    assert api_server.get_cached_prediction(model, 'predict:y') is None
+
+
+def test_batch_model_failure_returns_json_error(model_file, monkeypatch):
+    closed = []
+    
+    def batches():
+        try:
+            yield sample_batch(3)
+            yield sample_batch(2)
+        finally:
+            closed.append(True)
+    
+    def fail(*args, **kwargs):
+        raise RuntimeError('model exploded')
+    
+    monkeypatch.setattr(api_server, 'iter_pipeline_batches', batches)
+    monkeypatch.setattr(api_server.predictor, 'predict', fail)
+    
+    response = api_server.app.test_client().post('/batch/predict')
+    
+    assert response.status_code == 500
+    assert response.get_json()['success'] is False
+    assert closed == [True]
@@ -0,0 +1,51 @@
+"""
+Tests for the compiled batch post-processing kernel
+"""
+
+import numpy as np
+import pandas as pd
+
+from api_server import failure_dates, numeric_column
+from fast_ops import RISK_LEVELS, postprocess_predictions
+from risk_predictor import PipelineRiskPredictor
+
+
+def test_accepts_readonly_pandas_views():
+    """float32 columns come back from to_numpy() as read-only views under copy-on-write"""
+    df = pd.DataFrame({
+        'failure_probability': np.array([0.1, 0.4, 0.6, 0.9], dtype=np.float32),
+        'age_years': np.array([10, 30, 10, 30], dtype=np.float32),
+        'corrosion_rate': np.array([0.05, 0.2, 0.05, 0.2], dtype=np.float32),
+    })
+    failure_prob = df['failure_probability'].to_numpy()
+    age_years = numeric_column(df, 'age_years')
+    corrosion_rate = numeric_column(df, 'corrosion_rate')
+
+    codes, days = postprocess_predictions(failure_prob, age_years, corrosion_rate)
+
+    assert list(RISK_LEVELS[codes]) == ['low', 'medium', 'high', 'critical']
+    assert np.isnan(days[0]) and not np.isnan(days[1:]).any()
+
+
+def test_accepts_writable_arrays():
+    values = np.array([0.2, 0.8], dtype=np.float32)
+    codes, _ = postprocess_predictions(values, np.zeros(2, np.float32), np.zeros(2, np.float32))
+    assert list(codes) == [0, 3]
+
+
+def test_matches_per_pipeline_methods():
+    rng = np.random.default_rng(0)
+    n = 2000
+    failure_prob = rng.random(n).astype(np.float32)
+    age_years = rng.uniform(0, 50, n).astype(np.float32)
+    corrosion_rate = rng.uniform(0, 0.3, n).astype(np.float32)
+
+    codes, days = postprocess_predictions(failure_prob, age_years, corrosion_rate)
+    dates = failure_dates(days)
+
+    predictor = PipelineRiskPredictor()
+    for i in range(n):
+        p = float(failure_prob[i])
+        pipeline = {'age_years': float(age_years[i]), 'corrosion_rate': float(corrosion_rate[i])}
+        assert RISK_LEVELS[codes[i]] == predictor._get_risk_level(p)
+        assert dates[i] == predictor._estimate_failure_date(p, pipeline)
@@ -0,0 +1,36 @@
+"""
+Tests for input validation in the pipeline risk predictor
+"""
+
+import pandas as pd
+import pytest
+
+from risk_predictor import PipelineRiskPredictor, create_sample_data
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    model = PipelineRiskPredictor()
+    model.train(create_sample_data(200))
+    return model
+
+
+def test_single_pipeline_without_known_features_is_rejected(predictor):
+    # The shape the backend posts for batch requests carries no pipeline attributes at top level
+    with pytest.raises(ValueError, match='No valid features'):
+        predictor.predict_single_pipeline({'pipelines': [{'id': 1}]})
+
+
+def test_single_pipeline_with_partial_features_is_scored(predictor):
+    result = predictor.predict_single_pipeline({'id': 1, 'age_years': 25, 'corrosion_rate': 0.15})
+    assert 0.0 <= result['failure_probability'] <= 1.0
+
+
+def test_frame_without_known_features_is_rejected(predictor):
+    with pytest.raises(ValueError, match='No valid features'):
+        predictor.predict(pd.DataFrame([1, 2]))
+
+
+def test_frame_with_partial_features_is_scored(predictor):
+    results = predictor.predict(pd.DataFrame([{'age_years': 25, 'material': 'HDPE'}]))
+    assert results['failure_probability'].shape == (1,)
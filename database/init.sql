@@ -134,3 +134,36 @@ CREATE TRIGGER update_pipelines_updated_at
     BEFORE UPDATE ON pipelines
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
+
+-- Create materialized view of per-pipeline risk factor aggregates for the AI model service
+CREATE MATERIALIZED VIEW pipeline_risk_features AS
+SELECT 
+    pipeline_id,
+    AVG(value) FILTER (WHERE factor_type = 'corrosion') as corrosion_rate,
+    AVG(value) FILTER (WHERE factor_type = 'depth') as depth_avg,
+    AVG(value) FILTER (WHERE factor_type = 'temperature') as temperature_avg,
+    AVG(severity_level) FILTER (WHERE factor_type = 'corrosion') as corrosion_severity,
+    AVG(severity_level) FILTER (WHERE factor_type = 'depth') as depth_variation,
+    AVG(severity_level) FILTER (WHERE factor_type = 'pressure') as pressure_fluctuation,
+    AVG(severity_level) FILTER (WHERE factor_type = 'temperature') as temperature_variation,
+    AVG(severity_level) as external_damage_risk
+FROM risk_factors
+GROUP BY pipeline_id;
+
+-- Unique index required for concurrent refreshes
+CREATE UNIQUE INDEX idx_pipeline_risk_features_pipeline_id ON pipeline_risk_features (pipeline_id);
+
+-- Function to refresh pipeline risk features after risk factor changes
+CREATE OR REPLACE FUNCTION refresh_pipeline_risk_features()
+RETURNS TRIGGER AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY pipeline_risk_features;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Refresh once per statement rather than once per modified row
+CREATE TRIGGER refresh_pipeline_risk_features_on_change
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON risk_factors
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION refresh_pipeline_risk_features();